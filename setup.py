@@ -64,6 +64,7 @@ setuptools.setup(
     long_description=README,
     include_package_data=True,
     install_requires=REQUIREMENTS,
+    extras_require={'speed': ['orjson']},
     classifiers=[
         'License :: OSI Approved :: MIT License',
         'Intended Audience :: Developers',
@@ -25,12 +25,12 @@ import asyncio
 import logging
 from discord.ext import commands
 from functools import partial
-from json import dumps
 from typing import Optional, Union
 
 from .errors import *
 from .player import Player
 from .node import Node
+from .websocket import _default_dumps
 
 
 __log__ = logging.getLogger(__name__)
@@ -70,7 +70,7 @@ class Client:
 
         self.nodes = {}
 
-        self._dumps = dumps
+        self._dumps = _default_dumps
 
         bot.add_listener(self.update_handler, 'on_socket_response')
 
@@ -196,12 +196,14 @@ class Client:
         return await node.build_track(identifier)
 
     def _get_players(self) -> dict:
-        players = []
+        return {player.guild_id: player for node in self.nodes.values() for player in node.players.values()}
 
+    def _find_player(self, guild_id: int) -> Optional[Player]:
         for node in self.nodes.values():
-            players.extend(node.players.values())
+            player = node.players.get(guild_id)
 
-        return {player.guild_id: player for player in players}
+            if player is not None:
+                return player
 
     def get_node(self, identifier: str) -> Optional[Node]:
         """Retrieve a Node with the given identifier.
@@ -230,7 +232,7 @@ class Client:
         if not nodes:
             return None
 
-        return sorted(nodes, key=lambda n: len(n.players))[0]
+        return min(nodes, key=lambda n: len(n.players))
 
     def get_node_by_region(self, region: str) -> Optional[Node]:
         """Retrieve the best available Node with the given region.
@@ -250,7 +252,7 @@ class Client:
         if not nodes:
             return None
 
-        return sorted(nodes, key=lambda n: len(n.players))[0]
+        return min(nodes, key=lambda n: len(n.players))
 
     def get_node_by_shard(self, shard_id: int) -> Optional[Node]:
         """Retrieve the best available Node with the given shard ID.
@@ -270,7 +272,7 @@ class Client:
         if not nodes:
             return None
 
-        return sorted(nodes, key=lambda n: len(n.players))[0]
+        return min(nodes, key=lambda n: len(n.players))
 
     def get_player(self, guild_id: int, *, cls=None, node_id=None, **kwargs) -> Player:
         """Retrieve a player for the given guild ID. If None, a player will be created and returned.
@@ -304,13 +306,8 @@ class Client:
         ZeroConnectedNodes
             There are no :class:`wavelink.node.Node`'s currently connected.
         """
-        players = self.players
-
-        try:
-            player = players[guild_id]
-        except KeyError:
-            pass
-        else:
+        player = self._find_player(guild_id)
+        if player is not None:
             return player
 
         guild = self.bot.get_guild(guild_id)
@@ -347,8 +344,8 @@ class Client:
                 region_options.append(node)
 
         if not shard_options and not region_options:
-            # Sort by len of node players
-            node = sorted(nodes, key=lambda n: len(n.players))[0]
+            # Pick the node with the fewest players
+            node = min(nodes, key=lambda n: len(n.players))
             player = cls(self.bot, guild_id, node, **kwargs)
             node.players[guild_id] = player
 
@@ -356,11 +353,11 @@ class Client:
 
         best = [n for n in shard_options if n in region_options]
         if best:
-            node = sorted(best, key=lambda n: len(n.players))[0]
+            node = min(best, key=lambda n: len(n.players))
         elif shard_options:
-            node = sorted(shard_options, key=lambda n: len(n.players))[0]
+            node = min(shard_options, key=lambda n: len(n.players))
         else:
-            node = sorted(region_options, key=lambda n: len(n.players))[0]
+            node = min(region_options, key=lambda n: len(n.players))
 
         player = cls(self.bot, guild_id, node, **kwargs)
         node.players[guild_id] = player
@@ -457,11 +454,8 @@ class Client:
         if data['t'] == 'VOICE_SERVER_UPDATE':
             guild_id = int(data['d']['guild_id'])
 
-            try:
-                player = self.players[guild_id]
-            except KeyError:
-                pass
-            else:
+            player = self._find_player(guild_id)
+            if player is not None:
                 await player._voice_server_update(data['d'])
 
         elif data['t'] == 'VOICE_STATE_UPDATE':
@@ -469,16 +463,13 @@ class Client:
                 return
 
             guild_id = int(data['d']['guild_id'])
-            try:
-                player = self.players[guild_id]
-            except KeyError:
-                pass
-            else:
+            player = self._find_player(guild_id)
+            if player is not None:
                 await player._voice_state_update(data['d'])
 
     def set_serializer(self, serializer_function) -> None:
         """Sets the JSON dumps function for use in the websocket.
-        The default one is the built-in JSON module.
+        The default one is orjson if it is installed, otherwise the built-in JSON module.
 
         Parameters
         ----------
@@ -20,7 +20,6 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
-import collections
 
 
 class Equalizer:
@@ -45,6 +44,8 @@ class Equalizer:
         self.raw = levels
 
         self._name = name
+        self._bands_key = None
+        self._bands_json = None
 
     def __str__(self):
         return self._name
@@ -57,14 +58,26 @@ class Equalizer:
         """The Equalizers friendly name."""
         return self._name
 
+    @property
+    def bands_json(self) -> str:
+        """The Equalizers bands serialized as a JSON array.
+
+        This is built from :attr:`eq` and cached, keyed on its band/gain pairs, so applying the same
+        Equalizer repeatedly does not re-serialize it while edits to :attr:`eq` are still picked up.
+        """
+        key = tuple((band['band'], band['gain']) for band in self.eq)
+
+        if key != self._bands_key:
+            self._bands_json = '[%s]' % ','.join('{"band":%d,"gain":%r}' % (band, float(gain)) for band, gain in key)
+            self._bands_key = key
+
+        return self._bands_json
+
     @staticmethod
     def _factory(levels: list):
-        _dict = collections.defaultdict(int)
-
-        _dict.update(levels)
-        _dict = [{"band": i, "gain": _dict[i]} for i in range(15)]
+        gains = dict(levels)
 
-        return _dict
+        return [{"band": i, "gain": gains.get(i, 0)} for i in range(15)]
 
     @classmethod
     def build(cls, *, levels: list, name: str = 'CustomEqualizer'):
@@ -22,7 +22,6 @@ SOFTWARE.
 """
 import asyncio
 import inspect
-import json
 import logging
 from discord.ext import commands
 from typing import Any, Callable, Dict, Optional, Union
@@ -31,7 +30,7 @@ from urllib.parse import quote
 from .backoff import ExponentialBackoff
 from .errors import *
 from .player import Player, Track, TrackPlaylist
-from .websocket import WebSocket
+from .websocket import WebSocket, _default_dumps
 
 
 __log__ = logging.getLogger(__name__)
@@ -71,7 +70,7 @@ class Node:
                  shard_id: int = None,
                  secure: bool = False,
                  heartbeat: float = None,
-                 dumps: Callable[[Dict[str, Any]], Union[str, bytes]] = json.dumps
+                 dumps: Callable[[Dict[str, Any]], Union[str, bytes]] = _default_dumps
                  ):
 
         self.host = host
@@ -190,7 +189,7 @@ class Node:
                 for track in data['tracks']:
                     tracks.append(Track(id_=track['track'], info=track['info']))
 
-                __log__.debug(f'REST | Found <{len(tracks)}> tracks with query <{query}> ({self.__repr__()})')
+                __log__.debug('REST | Found <%s> tracks with query <%s> (%r)', len(tracks), query, self)
 
                 return tracks
 
@@ -244,7 +243,7 @@ class Node:
 
     async def on_event(self, event) -> None:
         """Function which dispatches events when triggered on the Node."""
-        __log__.info(f'NODE | Event dispatched:: <{str(event)}> ({self.__repr__()})')
+        __log__.info('NODE | Event dispatched:: <%s> (%r)', event, self)
         await event.player.hook(event)
 
         if not self.hook:
@@ -285,6 +284,10 @@ class Node:
 
         del self._client.nodes[self.identifier]
 
-    async def _send(self, **data) -> None:
-        __log__.debug(f'NODE | Sending payload:: <{data}> ({self.__repr__()})')
-        await self._websocket._send(**data)
+    async def _send(self, data: Dict[str, Any]) -> None:
+        __log__.debug('NODE | Sending payload:: <%s> (%r)', data, self)
+        await self._websocket._send(data)
+
+    async def _send_raw(self, data: str) -> None:
+        __log__.debug('NODE | Sending raw payload:: <%s> (%r)', data, self)
+        await self._websocket._send_raw(data)
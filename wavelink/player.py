@@ -20,11 +20,13 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
+import asyncio
 import logging
 import time
 import re
 from discord.ext import commands
 from discord.gateway import DiscordWebSocket
+from time import monotonic
 from typing import Optional, Union
 
 from .errors import *
@@ -143,21 +145,63 @@ class Player:
         The channel the player is connected to. Could be None if the player is not connected.
     """
 
+    __slots__ = ('bot',
+                 'guild_id',
+                 'node',
+                 '_guild_id_str',
+                 '_stop_payload',
+                 '_destroy_payload',
+                 '_pause_payload',
+                 '_volume_payload',
+                 '_seek_payload',
+                 '_equalizer_payload',
+                 'last_update',
+                 'last_position',
+                 'position_timestamp',
+                 '_last_update_mono',
+                 '_voice_state',
+                 '_voice_state_flags',
+                 'volume',
+                 'paused',
+                 'current',
+                 '_equalizer',
+                 '_equalizer_task',
+                 '_equalizer_pending',
+                 'channel_id',
+                 '_new_track',
+                 # Keep arbitrary attributes and weak references working, the dict is only created on demand
+                 '__dict__',
+                 '__weakref__')
+
     def __init__(self, bot: Union[commands.Bot, commands.AutoShardedBot], guild_id: int, node, **kwargs):
         self.bot = bot
         self.guild_id = guild_id
         self.node = node
 
+        self._guild_id_str = str(guild_id)
+
+        # Pre-rendered payloads for the fixed-shape ops, only the trailing value varies
+        self._stop_payload = '{"op":"stop","guildId":"%s"}' % self._guild_id_str
+        self._destroy_payload = '{"op":"destroy","guildId":"%s"}' % self._guild_id_str
+        self._pause_payload = '{"op":"pause","guildId":"%s","pause":%%s}' % self._guild_id_str
+        self._volume_payload = '{"op":"volume","guildId":"%s","volume":%%d}' % self._guild_id_str
+        self._seek_payload = '{"op":"seek","guildId":"%s","position":%%d}' % self._guild_id_str
+        self._equalizer_payload = '{"op":"equalizer","guildId":"%s","bands":%%s}' % self._guild_id_str
+
         self.last_update = None
         self.last_position = None
         self.position_timestamp = None
+        self._last_update_mono = None
 
         self._voice_state = {}
+        self._voice_state_flags = 0
 
         self.volume = 100
         self.paused = False
         self.current = None
         self._equalizer = Equalizer.flat()
+        self._equalizer_task = None
+        self._equalizer_pending = False
         self.channel_id = None
 
         self._new_track = False
@@ -180,7 +224,7 @@ class Player:
     @property
     def is_playing(self) -> bool:
         """Returns whether or not the player is currently playing."""
-        return self.is_connected and self.current is not None
+        return self.channel_id is not None and self.current is not None
 
     @property
     def is_paused(self) -> bool:
@@ -189,56 +233,58 @@ class Player:
 
     @property
     def position(self):
-        if not self.is_playing:
-            return 0
-
-        if not self.current:
+        if self.channel_id is None or self.current is None:
             return 0
 
         if self.paused:
             return min(self.last_position, self.current.duration)
 
-        difference = (time.time() * 1000) - self.last_update
+        if self._last_update_mono is None:
+            return 0
+
+        difference = (monotonic() - self._last_update_mono) * 1000
         position = self.last_position + difference
 
         if position > self.current.duration:
             return 0
 
-        return min(position, self.current.duration)
+        return position
 
     async def update_state(self, state: dict) -> None:
-        state = state['state']
+        self._update_state(state['state'])
 
+    def _update_state(self, state: dict) -> None:
         self.last_update = time.time() * 1000
+        self._last_update_mono = monotonic()
         self.last_position = state.get('position', 0)
         self.position_timestamp = state.get('time', 0)
 
     async def _voice_server_update(self, data) -> None:
-        self._voice_state.update({
-            'event': data
-        })
+        self._voice_state['event'] = data
+        self._voice_state_flags |= 2
 
         await self._dispatch_voice_update()
 
     async def _voice_state_update(self, data) -> None:
-        self._voice_state.update({
-            'sessionId': data['session_id']
-        })
+        self._voice_state['sessionId'] = data['session_id']
+        self._voice_state_flags |= 1
 
         channel_id = data['channel_id']
 
         if not channel_id:  # We're disconnecting
             self.channel_id = None
             self._voice_state.clear()
+            self._voice_state_flags = 0
             return
 
         self.channel_id = int(channel_id)
         await self._dispatch_voice_update()
 
     async def _dispatch_voice_update(self) -> None:
-        __log__.debug(f'PLAYER | Dispatching voice update:: {self.channel_id}')
-        if {'sessionId', 'event'} == self._voice_state.keys():
-            await self.node._send(op='voiceUpdate', guildId=str(self.guild_id), **self._voice_state)
+        __log__.debug('PLAYER | Dispatching voice update:: %s', self.channel_id)
+        # bit 0: sessionId received, bit 1: event received
+        if self._voice_state_flags == 3:
+            await self.node._send({'op': 'voiceUpdate', 'guildId': self._guild_id_str, **self._voice_state})
 
     async def hook(self, event) -> None:
         if isinstance(event, TrackEnd) and not self._new_track:
@@ -273,7 +319,7 @@ class Player:
 
         self.channel_id = channel_id
         await self._get_shard_socket(guild.shard_id).voice_state(self.guild_id, str(channel_id), self_deaf=self_deaf)
-        __log__.info(f'PLAYER | Connected to voice channel:: {self.channel_id}')
+        __log__.info('PLAYER | Connected to voice channel:: %s', self.channel_id)
 
     async def disconnect(self, *, force: bool = False) -> None:
         """|coro|
@@ -288,7 +334,7 @@ class Player:
         if not guild:
             raise InvalidIDProvided(f'No guild found for id <{self.guild_id}>')
 
-        __log__.info(f'PLAYER | Disconnected from voice channel:: {self.channel_id}')
+        __log__.info('PLAYER | Disconnected from voice channel:: %s', self.channel_id)
         self.channel_id = None
         await self._get_shard_socket(guild.shard_id).voice_state(self.guild_id, None)
 
@@ -311,6 +357,7 @@ class Player:
         """
         if replace or not self.is_playing:
             self.last_update = 0
+            self._last_update_mono = None
             self.last_position = 0
             self.position_timestamp = 0
             self.paused = False
@@ -325,7 +372,7 @@ class Player:
         self.current = track
 
         payload = {'op': 'play',
-                   'guildId': str(self.guild_id),
+                   'guildId': self._guild_id_str,
                    'track': track.id,
                    'noReplace': no_replace,
                    'startTime': str(start)
@@ -333,17 +380,17 @@ class Player:
         if end > 0:
             payload['endTime'] = str(end)
 
-        await self.node._send(**payload)
+        await self.node._send(payload)
 
-        __log__.debug(f'PLAYER | Started playing track:: {str(track)} ({self.channel_id})')
+        __log__.debug('PLAYER | Started playing track:: %s (%s)', track, self.channel_id)
 
     async def stop(self) -> None:
         """|coro|
 
         Stop the Player's currently playing song.
         """
-        await self.node._send(op='stop', guildId=str(self.guild_id))
-        __log__.debug(f'PLAYER | Current track stopped:: {str(self.current)} ({self.channel_id})')
+        await self.node._send_raw(self._stop_payload)
+        __log__.debug('PLAYER | Current track stopped:: %s (%s)', self.current, self.channel_id)
         self.current = None
 
     async def destroy(self, *, force: bool = False) -> None:
@@ -351,38 +398,90 @@ class Player:
 
         Stop the player, and remove any internal references to it.
         """
+        if self._equalizer_task is not None:
+            self._equalizer_task.cancel()
+            self._equalizer_task = None
+        self._equalizer_pending = False
+
         await self.stop()
         await self.disconnect(force=force)
 
-        await self.node._send(op='destroy', guildId=str(self.guild_id))
+        await self.node._send_raw(self._destroy_payload)
 
         try:
             del self.node.players[self.guild_id]
         except KeyError:
             pass
 
-    async def set_eq(self, equalizer: Equalizer) -> None:
+    async def set_eq(self, equalizer: Equalizer, *, force: bool = False) -> None:
         """|coro|
 
         Set the Players Equalizer.
 
+        The Equalizer is sent immediately. Further changes made within a short window (10ms) after a send are
+        coalesced, and only the most recent Equalizer is sent to the node when the window closes. For those
+        coalesced calls this coroutine returns before anything is sent, and any error while sending is logged
+        instead of raised. Pass ``force=True`` to always send immediately and have errors raised to the caller.
+
         .. versionchanged:: 0.5.0
             set_eq now accepts an :class:`Equalizer` instead of raw band/gain pairs.
 
+        .. versionchanged:: 0.9.11
+            Rapid Equalizer changes are coalesced by default. Added the ``force`` keyword argument to always
+            send immediately.
+
         Parameters
         ------------
         equalizer: :class:`Equalizer`
             The Equalizer to set.
+        force: bool
+            Whether to send the Equalizer immediately instead of coalescing it. Defaults to False.
         """
-        await self.node._send(op='equalizer', guildId=str(self.guild_id), bands=equalizer.eq)
         self._equalizer = equalizer
 
-    async def set_equalizer(self, equalizer: Equalizer) -> None:
+        if force:
+            if self._equalizer_task is not None:
+                self._equalizer_task.cancel()
+                self._equalizer_task = None
+            self._equalizer_pending = False
+
+            await self._send_equalizer()
+        elif self._equalizer_task is None or self._equalizer_task.done():
+            # Open the coalescing window before sending, so calls made during this send are coalesced too
+            self._equalizer_task = self.bot.loop.create_task(self._flush_equalizer())
+            self._equalizer_task.add_done_callback(self._equalizer_flushed)
+
+            await self._send_equalizer()
+        else:
+            self._equalizer_pending = True
+
+    def _equalizer_flushed(self, task: asyncio.Task) -> None:
+        if self._equalizer_task is task:
+            self._equalizer_task = None
+
+        if task.cancelled():
+            return
+
+        error = task.exception()
+        if error is not None:
+            __log__.error('PLAYER | Failed to send equalizer:: %s (%s)', error, self.channel_id, exc_info=error)
+
+    async def _flush_equalizer(self) -> None:
+        await asyncio.sleep(0.01)
+
+        while self._equalizer_pending:
+            self._equalizer_pending = False
+            await self._send_equalizer()
+
+    async def _send_equalizer(self) -> None:
+        await self.node._send_raw(self._equalizer_payload % self._equalizer.bands_json)
+
+    async def set_equalizer(self, equalizer: Equalizer, *, force: bool = False) -> None:
         """|coro|
 
         An alias to :func:`set_eq`.
         """
-        await self.set_eq(equalizer)
+        await self.set_eq(equalizer, force=force)
 
     async def set_pause(self, pause: bool) -> None:
         """|coro|
@@ -394,9 +493,9 @@ class Player:
         pause: bool
             A bool indicating if the player's paused state should be set to True or False.
         """
-        await self.node._send(op='pause', guildId=str(self.guild_id), pause=pause)
+        await self.node._send_raw(self._pause_payload % ('true' if pause else 'false'))
         self.paused = pause
-        __log__.debug(f'PLAYER | Set pause:: {self.paused} ({self.channel_id})')
+        __log__.debug('PLAYER | Set pause:: %s (%s)', self.paused, self.channel_id)
 
     async def set_volume(self, vol: int) -> None:
         """|coro|
@@ -408,9 +507,10 @@ class Player:
         vol: int
             The volume to set the player to.
         """
-        self.volume = max(min(vol, 1000), 0)
-        await self.node._send(op='volume', guildId=str(self.guild_id), volume=self.volume)
-        __log__.debug(f'PLAYER | Set volume:: {self.volume} ({self.channel_id})')
+        vol = int(vol)
+        self.volume = 0 if vol < 0 else (1000 if vol > 1000 else vol)
+        await self.node._send_raw(self._volume_payload % self.volume)
+        __log__.debug('PLAYER | Set volume:: %s (%s)', self.volume, self.channel_id)
 
     async def seek(self, position: int = 0) -> None:
         """Seek to the given position in the song.
@@ -421,7 +521,7 @@ class Player:
             The position as an int in milliseconds to seek to. Could be None to seek to beginning.
         """
 
-        await self.node._send(op='seek', guildId=str(self.guild_id), position=position)
+        await self.node._send_raw(self._seek_payload % int(position or 0))
 
     async def change_node(self, identifier: str = None) -> None:
         """|coro|
@@ -464,7 +564,7 @@ class Player:
 
         old = self.node
         del old.players[self.guild_id]
-        await old._send(op='destroy', guildId=str(self.guild_id))
+        await old._send_raw(self._destroy_payload)
 
         self.node = node
         self.node.players[int(self.guild_id)] = self
@@ -473,11 +573,13 @@ class Player:
             await self._dispatch_voice_update()
 
         if self.current:
-            await self.node._send(op='play', guildId=str(self.guild_id), track=self.current.id, startTime=int(self.position))
-            self.last_update = time.time() * 1000
+            position = int(self.position)
+
+            await self.node._send({'op': 'play', 'guildId': self._guild_id_str, 'track': self.current.id, 'startTime': position})
+            self._update_state({'position': position, 'time': self.position_timestamp})
 
             if self.paused:
-                await self.node._send(op='pause', guildId=str(self.guild_id), pause=self.paused)
+                await self.node._send_raw(self._pause_payload % 'true')
 
         if self.volume != 100:
-            await self.node._send(op='volume', guildId=str(self.guild_id), volume=self.volume)
+            await self.node._send_raw(self._volume_payload % self.volume)
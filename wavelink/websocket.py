@@ -31,9 +31,22 @@ from .backoff import ExponentialBackoff
 from .events import *
 from .stats import Stats
 
+try:
+    from orjson import dumps as _default_dumps
+except ImportError:
+    from json import dumps as _default_dumps
+
 
 __log__ = logging.getLogger(__name__)
 
+_EVENT_PAYLOADS = {
+    'TrackEndEvent': ('on_track_end', TrackEnd),
+    'TrackStartEvent': ('on_track_start', TrackStart),
+    'TrackExceptionEvent': ('on_track_exception', TrackException),
+    'TrackStuckEvent': ('on_track_stuck', TrackStuck),
+    'WebSocketClosedEvent': ('on_websocket_closed', WebsocketClosed),
+}
+
 
 class WebSocket:
 
@@ -104,7 +117,7 @@ class WebSocket:
             msg = await self._websocket.receive()
 
             if msg.type is aiohttp.WSMsgType.CLOSED:
-                __log__.debug(f'WEBSOCKET | Close data: {msg.extra}')
+                __log__.debug('WEBSOCKET | Close data: %s', msg.extra)
 
                 self._closed = True
                 retry = backoff.delay()
@@ -115,7 +128,7 @@ class WebSocket:
                 if not self.is_connected:
                     self.bot.loop.create_task(self._connect())
             else:
-                __log__.debug(f'WEBSOCKET | Received Payload:: <{msg.data}>')
+                __log__.debug('WEBSOCKET | Received Payload:: <%s>', msg.data)
                 self.bot.loop.create_task(self.process_data(msg.json()))
 
     async def process_data(self, data: Dict[str, Any]):
@@ -123,9 +136,15 @@ class WebSocket:
         if not op:
             return
 
-        if op == 'stats':
-            self._node.stats = Stats(self._node, data)
-        if op == 'event':
+        # Ordered by frequency, playerUpdate is sent for every playing player
+        if op == 'playerUpdate':
+            __log__.debug('WEBSOCKET | op: playerUpdate:: %s', data)
+            try:
+                await self._node.players[int(data['guildId'])].update_state(data)
+            except KeyError:
+                pass
+
+        elif op == 'event':
             try:
                 data['player'] = self._node.players[int(data['guildId'])]
             except KeyError:
@@ -133,7 +152,7 @@ class WebSocket:
 
             listener, payload = self._get_event_payload(data['type'], data)
 
-            __log__.debug(f'WEBSOCKET | op: event:: {data}')
+            __log__.debug('WEBSOCKET | op: event:: %s', data)
 
             # Dispatch node event/player hooks
             try:
@@ -144,28 +163,20 @@ class WebSocket:
             # Dispatch listeners
             await self.client._dispatch_listeners(listener, self._node, payload)
 
-        elif op == 'playerUpdate':
-            __log__.debug(f'WEBSOCKET | op: playerUpdate:: {data}')
-            try:
-                await self._node.players[int(data['guildId'])].update_state(data)
-            except KeyError:
-                pass
+        elif op == 'stats':
+            self._node.stats = Stats(self._node, data)
 
     def _get_event_payload(self, name: str, data):
-        if name == 'TrackEndEvent':
-            return 'on_track_end', TrackEnd(data)
-        elif name == 'TrackStartEvent':
-            return 'on_track_start', TrackStart(data)
-        elif name == 'TrackExceptionEvent':
-            return 'on_track_exception', TrackException(data)
-        elif name == 'TrackStuckEvent':
-            return 'on_track_stuck', TrackStuck(data)
-        elif name == 'WebSocketClosedEvent':
-            return 'on_websocket_closed', WebsocketClosed(data)
-
-    async def _send(self, **data):
+        try:
+            listener, cls = _EVENT_PAYLOADS[name]
+        except KeyError:
+            return None
+
+        return listener, cls(data)
+
+    async def _send(self, data: Dict[str, Any]):
         if self.is_connected:
-            __log__.debug(f'WEBSOCKET | Sending Payload:: {data}')
+            __log__.debug('WEBSOCKET | Sending Payload:: %s', data)
             data_str = self._dumps(data)
             if isinstance(data_str, bytes):
                 # Some JSON libraries serialize to bytes
@@ -175,3 +186,8 @@ class WebSocket:
                 # if Lavalink ever implements it
                 data_str = data_str.decode('utf-8')
             await self._websocket.send_str(data_str)
+
+    async def _send_raw(self, data: str):
+        if self.is_connected:
+            __log__.debug('WEBSOCKET | Sending Payload:: %s', data)
+            await self._websocket.send_str(data)